@@ -85,6 +85,39 @@ def alaw(x, abs_max=1, a=87.6):
     return nn.ALawCompression._func(x, abs_max=abs_max, a=a)
 
 
+def analyze(b=None, a=None, *, fft_length=512):
+    """Compute power spectrum, phase spectrum, and group delay at once.
+
+    The FFTs of the coefficients are shared among the three outputs, which are the
+    same as those of :func:`spec`, :func:`phase`, and :func:`grpdelay` with their
+    default options.
+
+    Parameters
+    ----------
+    b : Tensor [shape=(..., M+1)] or None
+        Numerator coefficients.
+
+    a : Tensor [shape=(..., N+1)] or None
+        Denominator coefficients.
+
+    fft_length : int >= 2
+        Number of FFT bins, :math:`L`.
+
+    Returns
+    -------
+    s : Tensor [shape=(..., L/2+1)]
+        Power spectrum.
+
+    p : Tensor [shape=(..., L/2+1)]
+        Phase spectrum [:math:`\\pi` rad].
+
+    g : Tensor [shape=(..., L/2+1)]
+        Group delay.
+
+    """
+    return nn.SpectralAnalysis._func(b, a, fft_length=fft_length)
+
+
 def b2mc(b, alpha=0):
     """Convert MLSA filter coefficients to mel-cepstrum.
 
@@ -290,7 +323,8 @@ def decimate(x, period=1, start=0, dim=-1):
     Returns
     -------
     out : Tensor [shape=(..., T/P-S, ...)]
-        Decimated signal.
+        Decimated signal. This is a view of the input, so in-place operations on
+        it also modify the input.
 
     """
     return nn.Decimation._func(x, period=period, start=start, dim=dim)
@@ -351,7 +385,7 @@ def dequantize(y, abs_max=1, n_bit=8, quantizer="mid-rise"):
     Parameters
     ----------
     y : Tensor [shape=(...,)]
-        Quantized input.
+        Quantized input. Integer types, e.g., uint8, are also accepted.
 
     abs_max : float > 0
         Absolute maximum value of input.
@@ -1,6 +1,7 @@
 from .acorr import Autocorrelation
 from .acr2csm import AutocorrelationToCompositeSinusoidalModelCoefficients
 from .alaw import ALawCompression
+from .analyze import SpectralAnalysis
 from .ap import Aperiodicity
 from .b2mc import MLSADigitalFilterCoefficientsToMelCepstrum
 from .c2acr import CepstrumToAutocorrelation
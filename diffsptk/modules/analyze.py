@@ -0,0 +1,120 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import torch
+from torch import nn
+
+from ..misc.utils import remove_gain
+from .grpdelay import GroupDelay
+from .phase import Phase
+from .spec import Spectrum
+
+
+class SpectralAnalysis(nn.Module):
+    """Compute power spectrum, phase spectrum, and group delay at once.
+
+    The FFTs of the coefficients are shared among the three outputs, which are the
+    same as those of :class:`Spectrum`, :class:`Phase`, and :class:`GroupDelay` with
+    their default options.
+
+    Parameters
+    ----------
+    fft_length : int >= 2
+        Number of FFT bins, :math:`L`.
+
+    """
+
+    def __init__(self, fft_length):
+        super().__init__()
+
+        assert 2 <= fft_length
+
+        self.fft_length = fft_length
+        self.register_buffer("ramp", GroupDelay._precompute(self.fft_length))
+
+    def forward(self, b=None, a=None):
+        """Compute power spectrum, phase spectrum, and group delay.
+
+        Parameters
+        ----------
+        b : Tensor [shape=(..., M+1)] or None
+            Numerator coefficients.
+
+        a : Tensor [shape=(..., N+1)] or None
+            Denominator coefficients.
+
+        Returns
+        -------
+        s : Tensor [shape=(..., L/2+1)]
+            Power spectrum.
+
+        p : Tensor [shape=(..., L/2+1)]
+            Phase spectrum [:math:`\\pi` rad].
+
+        g : Tensor [shape=(..., L/2+1)]
+            Group delay.
+
+        Examples
+        --------
+        >>> x = diffsptk.ramp(3)
+        >>> analyze = diffsptk.SpectralAnalysis(8)
+        >>> s, p, g = analyze(x)
+        >>> g
+        tensor([2.3333, 2.4278, 3.0000, 3.9252, 3.0000])
+
+        """
+        return self._forward(b, a, self.fft_length, self.ramp)
+
+    @staticmethod
+    def _forward(b, a, fft_length, ramp):
+        if b is None and a is None:
+            raise ValueError("Either b or a must be specified.")
+
+        # Unlike GroupDelay, the delays of b and a are computed separately and
+        # subtracted, so no convolution is formed and L >= max(M+1, N+1) suffices.
+        def transform(x):
+            data_length = x.size(-1)
+            GroupDelay._check(fft_length, data_length)
+            X = torch.fft.rfft(x, n=fft_length)
+            Y = torch.fft.rfft(x * ramp[:data_length], n=fft_length)
+            power = Spectrum._power(X)
+            delay = GroupDelay._ratio(X.real, X.imag, Y.real, Y.imag, power)
+            return X, power, delay
+
+        B = A = K = s_b = s_a = None
+        g = 0
+        if b is not None:
+            B, s_b, g_b = transform(b)
+            g = g + g_b
+        if a is not None:
+            K, a = remove_gain(a, return_gain=True)
+            A, s_a, g_a = transform(a)
+            g = g - g_a
+
+        s = Spectrum._combine(s_b, s_a, K)
+        p = Phase._angle(B, A)
+        return s, p, g
+
+    @staticmethod
+    def _func(b, a, fft_length):
+        if b is None and a is None:
+            raise ValueError("Either b or a must be specified.")
+        x = a if b is None else b
+        data_length = max(y.size(-1) for y in (b, a) if y is not None)
+        ramp = GroupDelay._precompute_cached(
+            data_length, dtype=x.dtype, device=x.device
+        )
+        return SpectralAnalysis._forward(b, a, fft_length, ramp)
@@ -14,7 +14,6 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
-import torch
 from torch import nn
 
 
@@ -56,7 +55,8 @@ class Decimation(nn.Module):
         Returns
         -------
         out : Tensor [shape=(..., T/P-S, ...)]
-            Decimated signal.
+            Decimated signal. This is a view of the input, so in-place operations on
+            it also modify the input.
 
         Examples
         --------
@@ -71,9 +71,10 @@ class Decimation(nn.Module):
 
     @staticmethod
     def _forward(x, period, start, dim):
-        T = x.shape[dim]
-        indices = torch.arange(start, T, period, dtype=torch.long, device=x.device)
-        y = torch.index_select(x, dim, indices)
+        # Slicing returns a strided view without copying data.
+        index = [slice(None)] * x.dim()
+        index[dim] = slice(start, None, period)
+        y = x[tuple(index)]
         return y
 
     _func = _forward
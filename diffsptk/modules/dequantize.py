@@ -17,6 +17,8 @@
 import torch
 from torch import nn
 
+from ..misc.utils import to
+
 
 class InverseUniformQuantization(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/dequantize.html>`_
@@ -50,7 +52,7 @@ class InverseUniformQuantization(nn.Module):
         Parameters
         ----------
         y : Tensor [shape=(...,)]
-            Quantized input.
+            Quantized input. Integer types, e.g., uint8, are also accepted.
 
         Returns
         -------
@@ -73,6 +75,8 @@ class InverseUniformQuantization(nn.Module):
 
     @staticmethod
     def _forward(y, abs_max, level, func):
+        if not torch.is_floating_point(y):
+            y = to(y)
         y = func(y)
         x = y * (2 * abs_max / level)
         x = torch.clip(x, min=-abs_max, max=abs_max)
@@ -14,6 +14,9 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import functools
+import math
+
 import torch
 from torch import nn
 import torch.nn.functional as F
@@ -107,19 +110,24 @@ class GroupDelay(nn.Module):
             c = (b2 * a.unsqueeze(-1)).sum(-2)
 
         data_length = c.size(-1)
-        if fft_length < data_length:
-            raise RuntimeError("Please increase FFT length.")
+        GroupDelay._check(fft_length, data_length)
 
         d = c * ramp[:data_length]
-        C = torch.fft.rfft(c, n=fft_length)
-        D = torch.fft.rfft(d, n=fft_length)
-
-        numer = C.real * D.real + C.imag * D.imag
-        denom = C.real * C.real + C.imag * C.imag
-        if gamma != 1:
-            denom = torch.pow(denom, gamma)
+        if data_length < 2 * math.log2(fft_length):
+            # Compute DFT directly since it costs O(ML) while the FFT costs O(L log L).
+            W = GroupDelay._precompute_dft(
+                fft_length, data_length, dtype=c.dtype, device=c.device
+            )
+            C_real, C_imag = torch.chunk(torch.matmul(c, W), 2, dim=-1)
+            D_real, D_imag = torch.chunk(torch.matmul(d, W), 2, dim=-1)
+        else:
+            C = torch.fft.rfft(c, n=fft_length)
+            D = torch.fft.rfft(d, n=fft_length)
+            C_real, C_imag = C.real, C.imag
+            D_real, D_imag = D.real, D.imag
 
-        g = numer / denom - order
+        denom = C_real * C_real + C_imag * C_imag
+        g = GroupDelay._ratio(C_real, C_imag, D_real, D_imag, denom, gamma) - order
         if alpha != 1:
             g = torch.sign(g) * torch.pow(torch.abs(g), alpha)
         return g
@@ -132,14 +140,45 @@ class GroupDelay(nn.Module):
             data_length = b.size(-1)
         else:
             data_length = a.size(-1)
-        ramp = GroupDelay._precompute(
+        ramp = GroupDelay._precompute_cached(
             data_length,
             dtype=a.dtype if b is None else b.dtype,
             device=a.device if b is None else b.device,
         )
         return GroupDelay._forward(b, a, fft_length, alpha, gamma, ramp)
 
+    @staticmethod
+    def _check(fft_length, data_length):
+        if fft_length < data_length:
+            raise RuntimeError("Please increase FFT length.")
+
+    @staticmethod
+    def _ratio(C_real, C_imag, D_real, D_imag, denom, gamma=1):
+        numer = C_real * D_real + C_imag * D_imag
+        if gamma != 1:
+            denom = torch.pow(denom, gamma)
+        return numer / denom
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _precompute_cached(length, dtype=None, device=None):
+        # The cached tensor must be usable by autograd even if the first call is made
+        # in inference mode.
+        with torch.inference_mode(False):
+            return GroupDelay._precompute(length, dtype=dtype, device=device)
+
     @staticmethod
     def _precompute(length, dtype=None, device=None):
         ramp = torch.arange(length, device=device)
         return to(ramp, dtype=dtype)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _precompute_dft(fft_length, data_length, dtype=None, device=None):
+        # The cached tensor is shared, so it must not be an inference tensor.
+        with torch.inference_mode(False):
+            n = torch.arange(data_length, dtype=torch.double, device=device)
+            k = torch.arange(fft_length // 2 + 1, dtype=torch.double, device=device)
+            omega = torch.outer(n, k) * (2 * torch.pi / fft_length)
+            W = torch.cat([torch.cos(omega), -torch.sin(omega)], dim=-1)
+            return to(W, dtype=dtype)
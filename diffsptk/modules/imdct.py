@@ -148,9 +148,9 @@ class InverseModifiedDiscreteTransform(nn.Module):
 
     @staticmethod
     def _func(y, window, **kwargs):
-        W = InverseModifiedDiscreteTransform._precompute(
+        W = ModifiedDiscreteTransform._precompute_cached(
             2 * y.size(-1), window, dtype=y.dtype, device=y.device, **kwargs
-        )
+        ).T
         return InverseModifiedDiscreteTransform._forward(y, W)
 
     @staticmethod
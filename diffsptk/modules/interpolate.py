@@ -77,8 +77,9 @@ class Interpolation(nn.Module):
         size[dim] = T
 
         y = torch.zeros(size, dtype=x.dtype, device=x.device)
-        indices = torch.arange(start, T, period, dtype=torch.long, device=x.device)
-        y.index_add_(dim, indices, x)
+        index = [slice(None)] * x.dim()
+        index[dim] = slice(start, None, period)
+        y[tuple(index)] = x
         return y
 
     _func = _forward
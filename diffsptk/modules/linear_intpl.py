@@ -14,10 +14,8 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import torch
 from torch import nn
-import torch.nn.functional as F
-
-from ..misc.utils import replicate1
 
 
 class LinearInterpolation(nn.Module):
@@ -77,17 +75,14 @@ class LinearInterpolation(nn.Module):
         elif d == 2:
             x = x.unsqueeze(0)
         assert x.dim() == 3, "Input must be 3D tensor."
-        B, T, D = x.shape
-
-        x = x.transpose(-2, -1).contiguous()  # (B, D, T)
-        x = replicate1(x, left=False)
-        x = F.interpolate(
-            x,
-            size=T * upsampling_factor + 1,
-            mode="linear",
-            align_corners=True,
-        )[..., :-1]  # Remove the padded value.
-        y = x.transpose(-2, -1).reshape(B, -1, D)
+        B, _, D = x.shape
+
+        # Compute all polyphase components at once by lerping adjacent frames.
+        x0 = x.unsqueeze(-2)  # (B, T, 1, D)
+        x1 = torch.cat((x[:, 1:], x[:, -1:]), dim=1).unsqueeze(-2)
+        w = torch.arange(upsampling_factor, dtype=x.dtype, device=x.device)
+        w = (w / upsampling_factor).unsqueeze(-1)  # (P, 1)
+        y = torch.lerp(x0, x1, w).reshape(B, -1, D)
 
         if d == 1:
             y = y.view(-1)
@@ -98,47 +98,23 @@ class MagicNumberInterpolationImpl(torch.autograd.Function):
         B, T, D = x.shape
 
         def compute_lerp_inputs(x, magic_number):
-            is_magic_number = x == magic_number
-
-            starts = []
-            ends = []
-            weights = []
-            for i in range(x.size(0)):
-                uniques, counts = torch.unique_consecutive(
-                    is_magic_number[i],
-                    return_inverse=False,
-                    return_counts=True,
-                    dim=-1,
-                )
-                w = torch.repeat_interleave(uniques / (counts + 1), counts, dim=-1)
-                if uniques[0]:
-                    w[..., : counts[0]] = 0
-                w = torch.cumsum(w, dim=-1)
-                w = w - torch.cummax(w * ~is_magic_number[i], dim=-1)[0]
-                if uniques[0]:
-                    w[..., : counts[0]] = 1
-                if uniques[-1]:
-                    w[..., -counts[-1] :] = 0
-
-                uniques, indices = torch.unique_consecutive(
-                    x[i],
-                    return_inverse=True,
-                    return_counts=False,
-                    dim=-1,
-                )
-                pos = uniques == magic_number
-                uniques[pos] = torch.roll(uniques, 1, dims=-1)[pos]
-                s = uniques[indices]
-                uniques[pos] = torch.roll(uniques, -1, dims=-1)[pos]
-                e = uniques[indices]
-
-                starts.append(s)
-                ends.append(e)
-                weights.append(w)
-
-            starts = torch.stack(starts)
-            ends = torch.stack(ends)
-            weights = torch.stack(weights)
+            is_valid = x != magic_number
+            index = torch.arange(T, device=x.device)
+
+            # Find the nearest valid indices before and after each point.
+            prev_index = torch.cummax(torch.where(is_valid, index, -1), dim=-1)[0]
+            next_index = torch.where(is_valid, index, T).flip(-1)
+            next_index = torch.cummin(next_index, dim=-1)[0].flip(-1)
+
+            starts = x.gather(-1, prev_index.clip(min=0))
+            ends = x.gather(-1, next_index.clip(max=T - 1))
+
+            # Extrapolate with the nearest valid value at both edges.
+            starts = torch.where(prev_index < 0, ends, starts)
+            ends = torch.where(T <= next_index, starts, ends)
+
+            weights = (index - prev_index) / (next_index - prev_index).clip(min=1)
+            weights = weights.to(x.dtype)
             return starts, ends, weights
 
         x = x.transpose(-2, -1).reshape(B * D, T)
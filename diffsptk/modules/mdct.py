@@ -14,6 +14,8 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import functools
+
 import torch
 from torch import nn
 import torch.nn.functional as F
@@ -136,11 +138,20 @@ class ModifiedDiscreteTransform(nn.Module):
 
     @staticmethod
     def _func(x, window, **kwargs):
-        W = ModifiedDiscreteTransform._precompute(
+        W = ModifiedDiscreteTransform._precompute_cached(
             x.size(-1), window, dtype=x.dtype, device=x.device, **kwargs
         )
         return ModifiedDiscreteTransform._forward(x, W)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _precompute_cached(length, window, transform="cosine", dtype=None, device=None):
+        # Avoid caching an inference tensor, which could not be used by autograd.
+        with torch.inference_mode(False):
+            return ModifiedDiscreteTransform._precompute(
+                length, window, transform, dtype=dtype, device=device
+            )
+
     @staticmethod
     def _precompute(length, window, transform="cosine", dtype=None, device=None):
         L2 = length
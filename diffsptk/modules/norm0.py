@@ -65,10 +65,9 @@ class AllPoleToAllZeroDigitalFilterCoefficients(nn.Module):
 
     @staticmethod
     def _forward(a):
-        K, a1 = torch.split(a, [1, a.size(-1) - 1], dim=-1)
-        b0 = torch.reciprocal(K)
-        b1 = a1 * b0
-        b = torch.cat((b0, b1), dim=-1)
+        b0 = torch.reciprocal(a[..., :1])
+        b = a * b0
+        b[..., :1] = b0
         return b
 
     _func = _forward
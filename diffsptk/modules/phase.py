@@ -74,15 +74,28 @@ class Phase(nn.Module):
         if b is None and a is None:
             raise ValueError("Either b or a must be specified.")
 
+        B = A = None
         if b is not None:
             B = torch.fft.rfft(b, n=fft_length)
         if a is not None:
             A = torch.fft.rfft(remove_gain(a), n=fft_length)
 
-        if b is None:
+        p = Phase._angle(B, A)
+        if unwrap:
+            diff = torch.diff(p, dim=-1)
+            bias = (-2 * (1 < diff)) + (2 * (diff < -1))
+            s = torch.cumsum(bias, dim=-1)
+            p[..., 1:] += s
+        return p
+
+    _func = _forward
+
+    @staticmethod
+    def _angle(B, A):
+        if B is None:
             numer = -A.imag
             denom = A.real
-        elif a is None:
+        elif A is None:
             numer = B.imag
             denom = B.real
         else:
@@ -92,12 +105,4 @@ class Phase(nn.Module):
 
         # Convert to cycle [-1, 1].
         p /= torch.pi
-
-        if unwrap:
-            diff = torch.diff(p, dim=-1)
-            bias = (-2 * (1 < diff)) + (2 * (diff < -1))
-            s = torch.cumsum(bias, dim=-1)
-            p[..., 1:] += s
         return p
-
-    _func = _forward
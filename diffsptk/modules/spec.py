@@ -88,20 +88,14 @@ class Spectrum(nn.Module):
         if b is None and a is None:
             raise ValueError("Either b or a must be specified.")
 
+        B = A = K = None
         if b is not None:
-            B = torch.fft.rfft(b, n=fft_length).abs()
+            B = Spectrum._power(torch.fft.rfft(b, n=fft_length))
         if a is not None:
             K, a = remove_gain(a, return_gain=True)
-            A = torch.fft.rfft(a, n=fft_length).abs()
+            A = Spectrum._power(torch.fft.rfft(a, n=fft_length))
 
-        if b is None:
-            X = K / A
-        elif a is None:
-            X = B
-        else:
-            X = K * (B / A)
-
-        s = torch.square(X) + eps
+        s = Spectrum._combine(B, A, K) + eps
         if relative_floor is not None:
             m = torch.amax(s, dim=-1, keepdim=True)
             s = torch.maximum(s, m * relative_floor)
@@ -114,6 +108,19 @@ class Spectrum(nn.Module):
         formatter = Spectrum._formatter(out_format)
         return Spectrum._forward(b, a, fft_length, eps, relative_floor, formatter)
 
+    @staticmethod
+    def _power(X):
+        # Work on power spectra to avoid taking the square root of complex values.
+        return torch.addcmul(torch.square(X.real), X.imag, X.imag)
+
+    @staticmethod
+    def _combine(B, A, K):
+        if B is None:
+            return torch.square(K) / A
+        elif A is None:
+            return B
+        return torch.square(K) * (B / A)
+
     @staticmethod
     def _precompute(relative_floor):
         if relative_floor is None:
@@ -17,6 +17,8 @@
 import pytest
 import torch
 
+import tests.utils as U
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -29,3 +31,17 @@ def set_default_dtype(request):
     torch.set_default_dtype(
         torch.float if request.config.getoption("--float") else torch.double
     )
+
+
+@pytest.fixture(scope="session")
+def nrand_cache():
+    cache = {}
+
+    def get(n, seed=None):
+        key = (n, seed)
+        if key not in cache:
+            cmd = f"nrand -l {n}" if seed is None else f"nrand -s {seed} -l {n}"
+            cache[key] = U.call(cmd)
+        return cache[key].copy()
+
+    return get
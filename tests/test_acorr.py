@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -24,7 +25,10 @@ import tests.utils as U
 @pytest.mark.parametrize("module", [False, True])
 @pytest.mark.parametrize("M", [12, 13])
 @pytest.mark.parametrize("out_format", [0, 1, 2, 3])
-def test_compatibility(device, module, M, out_format, L=14, B=2):
+def test_compatibility(device, module, M, out_format, nrand_cache, L=14, B=2):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
     acorr = U.choice(
         module,
         diffsptk.Autocorrelation,
@@ -37,7 +41,7 @@ def test_compatibility(device, module, M, out_format, L=14, B=2):
         device,
         acorr,
         [],
-        f"nrand -l {B*L}",
+        nrand_cache(B * L),
         f"acorr -l {L} -m {M} -o {out_format}",
         [],
         dx=L,
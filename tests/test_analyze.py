@@ -0,0 +1,68 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import pytest
+import torch
+
+import diffsptk
+import tests.utils as U
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+@pytest.mark.parametrize("module", [False, True])
+@pytest.mark.parametrize("inputs", ["ba", "b", "a"])
+def test_compatibility(device, module, inputs, L=16, M=7, N=3, B=2):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
+    b = torch.randn(B, M + 1, device=device) if "b" in inputs else None
+    a = torch.randn(B, N + 1, device=device) if "a" in inputs else None
+
+    if module:
+        analyze = diffsptk.SpectralAnalysis(L).to(device)
+    else:
+
+        def analyze(b=None, a=None):
+            return diffsptk.functional.analyze(b, a, fft_length=L)
+
+    s, p, g = analyze(b, a)
+    s_ = diffsptk.functional.spec(b, a, fft_length=L)
+    p_ = diffsptk.functional.phase(b, a, fft_length=L)
+    g_ = diffsptk.functional.grpdelay(b, a, fft_length=L)
+    assert U.allclose(s, s_)
+    assert U.allclose(p, p_)
+    assert U.allclose(g, g_)
+
+    shapes = [x.shape for x in (b, a) if x is not None]
+
+    def func(*x):
+        if inputs == "a":
+            x = (None, *x)
+        return sum(analyze(*x))
+
+    U.check_differentiability(device, func, shapes)
+
+
+def test_fft_length(L=8, N=3):
+    with pytest.raises(RuntimeError):
+        diffsptk.functional.analyze(torch.randn(L + 1), fft_length=L)
+
+    # No convolution is formed, so L >= max(M+1, N+1) is enough.
+    b = torch.randn(L)
+    a = torch.randn(N + 1)
+    _, _, g = diffsptk.functional.analyze(b, a, fft_length=L)
+    g_ = diffsptk.functional.grpdelay(b, a, fft_length=2 * L)[..., ::2]
+    assert U.allclose(g, g_)
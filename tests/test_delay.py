@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -44,3 +45,17 @@ def test_compatibility(device, module, S, keeplen, T=20, B=2):
     )
 
     U.check_differentiability(device, delay, [B, T])
+
+
+@pytest.mark.parametrize("module", [False, True])
+def test_long_delay(module, T=4):
+    delay = U.choice(
+        module,
+        diffsptk.Delay,
+        diffsptk.functional.delay,
+        {},
+        {"start": T + 1, "keeplen": True},
+    )
+
+    y = delay(diffsptk.ramp(1, T))
+    assert torch.equal(y, torch.zeros(T))
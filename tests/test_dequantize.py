@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -42,3 +43,13 @@ def test_compatibility(device, module, quantizer, v=10, n_bit=3, L=10):
     )
 
     U.check_differentiability(device, dequantize, [L])
+
+
+@pytest.mark.parametrize("quantizer", [0, 1])
+def test_integer_input(quantizer, v=10, n_bit=8):
+    quantize = diffsptk.UniformQuantization(v, n_bit, quantizer)
+    dequantize = diffsptk.InverseUniformQuantization(v, n_bit, quantizer)
+    y = quantize(diffsptk.ramp(-v, v))
+    x = dequantize(y)
+    x_hat = dequantize(y.to(torch.uint8))
+    assert torch.allclose(x, x_hat)
@@ -48,22 +48,20 @@ def test_compatibility(device, module, voiced_region, unvoiced_region, P=80):
 
     # Compute pitch and excitation on C++ version.
     cmd = "x2x +sd tools/SPTK/asset/data.short | "
-    cmd += f"pitch -s 16 -p {P} -o 0 -a 2 > excite.tmp1"
+    cmd += f"pitch -s 16 -p {P} -o 0 -a 2"
     n = 0 if unvoiced_region == "zeros" else 1
-    U.call(cmd, get=False)
-    U.call(f"excite -p {P} -n {n} excite.tmp1 > excite.tmp2", get=False)
+    pitch = U.call(cmd)
+    e_cc = U.call(f"excite -p {P} -n {n}", stdin=pitch)
 
     # Compute excitation on PyTorch version.
-    pitch = U.call("cat excite.tmp1")
-    pitch = np.expand_dims(pitch, 0)  # This is to cover a case.
-    e = excite(torch.from_numpy(pitch).to(device))
-    e.cpu().double().numpy().tofile("excite.tmp3")
+    p = np.expand_dims(pitch, 0)  # This is to cover a case.
+    e = excite(torch.from_numpy(p).to(device))
+    e_py = e.cpu().double().numpy()
 
-    def compute_error(infile):
-        cmd = f"sopr -magic 0 -m 10 -MAGIC 0 {infile} | "
+    def compute_error(e):
+        cmd = "sopr -magic 0 -m 10 -MAGIC 0 | "
         cmd += f"pitch -s 16 -p {P} -o 0 -a 2"
-        pitch = U.call("cat excite.tmp1")
-        recomputed_pitch = U.call(cmd)
+        recomputed_pitch = U.call(cmd, stdin=e)
 
         pitch_error = 0
         vuv_error = 0
@@ -74,16 +72,14 @@ def test_compatibility(device, module, voiced_region, unvoiced_region, P=80):
                 vuv_error += 1
         return pitch_error, vuv_error
 
-    pitch_error_cc, vuv_error_cc = compute_error("excite.tmp2")
-    pitch_error_py, vuv_error_py = compute_error("excite.tmp3")
+    pitch_error_cc, vuv_error_cc = compute_error(e_cc)
+    pitch_error_py, vuv_error_py = compute_error(e_py)
 
     tol = 0
     assert pitch_error_py <= pitch_error_cc + tol
     tol = 5
     assert vuv_error_py <= vuv_error_cc + tol
 
-    U.call("rm -f excite.tmp?", get=False)
-
 
 @pytest.mark.parametrize("voiced_region", ["pulse", "sinusoidal", "sawtooth"])
 def test_waveform(voiced_region, P=80, verbose=False):
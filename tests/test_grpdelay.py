@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -52,7 +53,11 @@ def test_compatibility(device, module, L=16, alpha=0.4, gamma=0.9, B=2):
 
 @pytest.mark.parametrize("device", ["cpu", "cuda"])
 @pytest.mark.parametrize("module", [False, True])
-def test_compatibility_b(device, module, L=16, B=2):
+@pytest.mark.parametrize("L", [16, 512])
+def test_compatibility_b(device, module, L, nrand_cache, M=8, B=2):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
     grpdelay = U.choice(
         module,
         diffsptk.GroupDelay,
@@ -62,12 +67,11 @@ def test_compatibility_b(device, module, L=16, B=2):
         n_input=1,
     )
 
-    M = L // 2
     U.check_compatibility(
         device,
         grpdelay,
         [],
-        f"nrand -s 1 -l {B*M}",
+        nrand_cache(B * M, seed=1),
         f"grpdelay -l {L} -m {M-1}",
         [],
         dx=M,
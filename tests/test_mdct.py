@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -23,7 +24,10 @@ import tests.utils as U
 @pytest.mark.parametrize("device", ["cpu", "cuda"])
 @pytest.mark.parametrize("module", [False, True])
 @pytest.mark.parametrize("window", ["sine", "vorbis", "kbd", "rectangular"])
-def test_compatibility(device, module, window, L=512):
+def test_compatibility(device, module, window, nrand_cache, L=512):
+    if device == "cuda" and not torch.cuda.is_available():
+        return
+
     mdct_params = {"frame_length": L, "window": window}
     mdct = U.choice(
         module,
@@ -38,7 +42,7 @@ def test_compatibility(device, module, window, L=512):
         device,
         [imdct, mdct],
         [],
-        f"nrand -l {L}",
+        nrand_cache(L),
         "sopr",
         [],
     )
@@ -59,21 +59,28 @@ def allclose(a, b, rtol=None, atol=None):
         rtol = 1e-5 if is_double else 1e-4
     if atol is None:
         atol = 1e-8 if is_double else 1e-6
+    if torch.is_tensor(a):
+        # Compare on the device of the output to avoid device-to-host copies.
+        b = torch.as_tensor(b, device=a.device)
+        dtype = torch.promote_types(a.dtype, b.dtype)
+        return torch.allclose(a.to(dtype), b.to(dtype), rtol=rtol, atol=atol)
     return np.allclose(a, b, rtol=rtol, atol=atol)
 
 
-def call(cmd, get=True):
+def call(cmd, get=True, stdin=None):
+    if stdin is not None:
+        stdin = np.asarray(stdin, dtype=np.double).tobytes()
     if get:
         res = subprocess.run(
             cmd + " | x2x +da -f %.15g",
             shell=True,
-            text=True,
+            input=stdin,
             stdout=subprocess.PIPE,
             check=False,
         )
         is_double = torch.get_default_dtype() == torch.double
         data = np.fromstring(
-            res.stdout, sep="\n", dtype=np.double if is_double else np.float32
+            res.stdout.decode(), sep="\n", dtype=np.double if is_double else np.float32
         )
         assert 0 < len(data), f"Failed to run command {cmd}"
         return data
@@ -81,6 +88,7 @@ def call(cmd, get=True):
         res = subprocess.run(
             cmd,
             shell=True,
+            input=stdin,
             stdout=subprocess.PIPE,
             check=False,
         )
@@ -116,7 +124,8 @@ def check_compatibility(
 
     x = []
     for i, cmd in enumerate(inputs):
-        x.append(torch.from_numpy(call(cmd)).to(device))
+        data = cmd if isinstance(cmd, np.ndarray) else call(cmd)
+        x.append(torch.from_numpy(data).to(device))
         if is_array(dx):
             if dx[i] is not None:
                 if is_array(dx[i]):
@@ -130,7 +139,10 @@ def check_compatibility(
                 x[-1] = x[-1].reshape(-1, dx)
 
     if len(setup) == 0:
-        y = call(f"{inputs[0]} | {target}")
+        if isinstance(inputs[0], np.ndarray):
+            y = call(target, stdin=inputs[0])
+        else:
+            y = call(f"{inputs[0]} | {target}")
     else:
         y = call(target)
     if dy is not None:
@@ -141,13 +153,13 @@ def check_compatibility(
 
     module = compose(*[m.to(device) if hasattr(m, "to") else m for m in modules])
     if len(key) == 0:
-        y_hat = module(*x, **opt).cpu().numpy()
+        y_hat = module(*x, **opt)
     else:
         x = {k: v for k, v in zip(key, x)}
-        y_hat = module(**x, **opt).cpu().numpy()
+        y_hat = module(**x, **opt)
 
     if sr is not None:
-        sf.write("output.wav", y_hat / 32768, sr)
+        sf.write("output.wav", y_hat.cpu().numpy() / 32768, sr)
         sf.write("target.wav", y / 32768, sr)
 
     if verbose:
@@ -157,6 +169,7 @@ def check_compatibility(
     if eq is None:
         assert allclose(y_hat, y, **kwargs), f"Output: {y_hat}\nTarget: {y}"
     else:
+        y_hat = y_hat.cpu().numpy()
         assert eq(y_hat, y, **kwargs), f"Output: {y_hat}\nTarget: {y}"
 
 